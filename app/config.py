@@ -28,14 +28,34 @@ class EmailConfig:
 class OpenAIConfig:
     api_key: str
     model: str
+    explanation_cache_path: str
+
+
+@dataclass(frozen=True)
+class WorkspaceConfig:
+    storage_root: str
+    tmpfs_root: str | None
+    tmpfs_quota_bytes: int
+    ttl_seconds: int
+    sweep_interval_seconds: int
+
+
+@dataclass(frozen=True)
+class TracingConfig:
+    enabled: bool
+    file_path: str
+    max_bytes: int
+    backup_count: int
 
 
 @dataclass(frozen=True)
 class AppConfig:
     storage_root: str
+    workspace: WorkspaceConfig
     stripe: StripeConfig
     email: EmailConfig
     openai: OpenAIConfig
+    tracing: TracingConfig
     brand_name: str = "Affordable Smart Contract Audits"
     brand_color: str = "#1F2937"
     report_footer: str = "Confidential – generated by Affordable Smart Contract Audits"
@@ -75,16 +95,36 @@ def load_config() -> AppConfig:
     openai_config = OpenAIConfig(
         api_key=_env("OPENAI_API_KEY"),
         model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+        explanation_cache_path=os.getenv(
+            "AUDIT_EXPLANATION_CACHE", "/tmp/audit-cache/explanations.sqlite3"
+        ),
     )
 
     storage_root = os.getenv("AUDIT_STORAGE_ROOT", "/tmp/audit-workspace")
     os.makedirs(storage_root, exist_ok=True)
 
+    workspace_config = WorkspaceConfig(
+        storage_root=storage_root,
+        tmpfs_root=os.getenv("AUDIT_TMPFS_ROOT") or None,
+        tmpfs_quota_bytes=int(os.getenv("AUDIT_TMPFS_QUOTA_MB", "256")) * 1024 * 1024,
+        ttl_seconds=int(os.getenv("AUDIT_WORKSPACE_TTL_SECONDS", "3600")),
+        sweep_interval_seconds=int(os.getenv("AUDIT_SWEEP_INTERVAL_SECONDS", "300")),
+    )
+
+    tracing_config = TracingConfig(
+        enabled=os.getenv("AUDIT_TRACING_ENABLED", "true").lower() in {"1", "true", "yes", "on"},
+        file_path=os.getenv("AUDIT_TRACE_FILE", "/tmp/audit-traces/traces.jsonl"),
+        max_bytes=int(os.getenv("AUDIT_TRACE_MAX_MB", "20")) * 1024 * 1024,
+        backup_count=int(os.getenv("AUDIT_TRACE_BACKUPS", "5")),
+    )
+
     return AppConfig(
         storage_root=storage_root,
+        workspace=workspace_config,
         stripe=stripe_config,
         email=email_config,
         openai=openai_config,
+        tracing=tracing_config,
     )
 
 
@@ -93,6 +133,8 @@ __all__ = [
     "StripeConfig",
     "EmailConfig",
     "OpenAIConfig",
+    "WorkspaceConfig",
+    "TracingConfig",
     "ConfigError",
     "load_config",
 ]
@@ -14,13 +14,14 @@ from app.services.payments import (
     init_stripe,
     verify_payment,
 )
+from app.services.report_export import JSON_MIME_TYPE, SARIF_MIME_TYPE
 from app.utils.file_manager import (
     FileValidationError,
-    create_workspace,
     persist_contract,
-    secure_delete,
     validate_contract_filename,
 )
+from app.utils.tracing import configure_tracing, start_span
+from app.utils.workspace_manager import WorkspaceManager
 
 PROMPT_TEMPLATE = Path(__file__).resolve().parent / "prompts" / "executive_summary_prompt.md"
 
@@ -34,6 +35,18 @@ def get_config():
         st.stop()
 
 
+@st.cache_resource(show_spinner=False)
+def get_workspace_manager() -> WorkspaceManager:
+    manager = WorkspaceManager(get_config().workspace)
+    manager.start()
+    return manager
+
+
+@st.cache_resource(show_spinner=False)
+def init_tracing() -> None:
+    configure_tracing(get_config().tracing)
+
+
 def _initialize_stripe():
     config = get_config()
     init_stripe(config.stripe)
@@ -94,6 +107,8 @@ def _process_success_flow() -> Optional[str]:
 
 def _audit_form():
     config = _initialize_stripe()
+    init_tracing()
+    get_workspace_manager()
     _render_sidebar(config.email.sender_email)
 
     st.title("Affordable Smart Contract Audits")
@@ -139,41 +154,67 @@ def _audit_form():
             st.error(str(exc))
             return
 
-        workspace = create_workspace(config.storage_root)
-        try:
-            contract_path = persist_contract(uploaded_contract, workspace)
-            pdf_path = prepare_pdf_path(workspace)
-            with st.spinner("Running automated analysis. This can take a few minutes..."):
-                slither_report, mythril_report, summary_text, generated_pdf = execute_audit(
-                    config,
-                    contract_path,
-                    PROMPT_TEMPLATE,
-                    pdf_path,
+        st.session_state.pop("report_downloads", None)
+        with start_span("audit") as audit_span:
+            workspace_manager = get_workspace_manager()
+            workspace = workspace_manager.create()
+            try:
+                contract_path = persist_contract(uploaded_contract, workspace)
+                pdf_path = prepare_pdf_path(workspace)
+                with st.spinner("Running automated analysis. This can take a few minutes..."):
+                    (
+                        slither_report,
+                        mythril_report,
+                        summary_text,
+                        generated_pdf,
+                        exports,
+                    ) = execute_audit(
+                        config,
+                        contract_path,
+                        PROMPT_TEMPLATE,
+                        pdf_path,
+                    )
+                st.success("Audit complete! Sending email...")
+                send_report(
+                    config.email,
+                    st.session_state["customer_email"],
+                    summary_text,
+                    generated_pdf,
+                    attachments=exports.paths(),
                 )
-            st.success("Audit complete! Sending email...")
-            send_report(config.email, st.session_state["customer_email"], summary_text, generated_pdf)
-            st.success("Report emailed successfully.")
-
-            st.download_button(
-                label="Download PDF Report",
-                data=generated_pdf.read_bytes(),
-                file_name=generated_pdf.name,
-                mime="application/pdf",
-            )
-
-            with st.expander("Slither Raw Output"):
-                st.json(slither_report)
-            with st.expander("Mythril Raw Output"):
-                st.json(mythril_report)
-
-        except Exception as exc:  # pragma: no cover - visible to user
-            st.error(f"Audit failed: {exc}")
-        finally:
-            secure_delete(workspace)
-            st.session_state.pop("payment_verified", None)
-            st.session_state.pop("checkout_url", None)
-            st.session_state.pop("customer_email", None)
+                st.success("Report emailed successfully.")
+
+                # Read the files before the workspace is released; every download
+                # click reruns the script, so the buttons are rendered from session state.
+                st.session_state["report_downloads"] = [
+                    (label, path.read_bytes(), path.name, mime)
+                    for label, path, mime in (
+                        ("Download PDF Report", generated_pdf, "application/pdf"),
+                        ("Download SARIF Report", exports.sarif_path, SARIF_MIME_TYPE),
+                        ("Download JSON Report", exports.json_path, JSON_MIME_TYPE),
+                    )
+                ]
+
+                with st.expander("Slither Raw Output"):
+                    st.json(slither_report)
+                with st.expander("Mythril Raw Output"):
+                    st.json(mythril_report)
+
+            except Exception as exc:  # pragma: no cover - visible to user
+                audit_span.record_exception(exc)
+                st.error(f"Audit failed: {exc} (trace ID: {audit_span.trace_id})")
+            finally:
+                workspace_manager.release(workspace)
+                st.session_state.pop("payment_verified", None)
+                st.session_state.pop("checkout_url", None)
+                st.session_state.pop("customer_email", None)
+
+
+def _render_downloads() -> None:
+    for label, data, file_name, mime in st.session_state.get("report_downloads", []):
+        st.download_button(label=label, data=data, file_name=file_name, mime=mime)
 
 
 if __name__ == "__main__":
     _audit_form()
+    _render_downloads()
@@ -1,38 +1,84 @@
-"""Generate AI summaries of audit findings."""
+"""Generate AI summaries of audit findings.
+
+Only the contract-specific executive overview is generated per audit. Generic
+explanations of each finding type (Slither detector or Mythril SWC) are cached by
+type, model and prompt hash, so recurring findings never hit the model twice.
+"""
 from __future__ import annotations
 
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 import openai
 
 from app.config import OpenAIConfig
+from app.services.explanation_cache import (
+    cache_key,
+    finding_type,
+    get_explanation_cache,
+    prompt_hash,
+)
+from app.services.report_export import Finding, collect_findings
+from app.utils.tracing import SPAN_KIND_CLIENT, current_span, start_span
 
+logger = logging.getLogger(__name__)
 
-def format_findings(slither_report: Dict[str, Any], mythril_report: Dict[str, Any]) -> str:
-    return json.dumps(
-        {
-            "slither": slither_report,
-            "mythril": mythril_report,
-        },
-        indent=2,
-    )
+EXPLANATION_PROMPT = Path(__file__).resolve().parents[1] / "prompts" / "finding_explanation_prompt.md"
 
+OVERVIEW_MAX_OUTPUT_TOKENS = 800
+_MESSAGE_CHAR_LIMIT = 400
+_EXPLANATION_TOKENS_PER_TYPE = 220
+# Types explained per request: keeps each reply well under the model's output cap, and
+# a truncated or failed reply only loses its own chunk instead of every uncached type.
+_EXPLANATION_CHUNK_SIZE = 8
+_EXPLANATION_MAX_PARALLEL = 4
 
-def generate_summary(
-    config: OpenAIConfig,
-    prompt_template_path: Path,
+
+def _tool_status(report: Dict[str, Any]) -> Dict[str, Any]:
+    return {"success": report.get("success", True), "error": report.get("error")}
+
+
+def format_findings(
     slither_report: Dict[str, Any],
     mythril_report: Dict[str, Any],
+    findings: Optional[List[Finding]] = None,
 ) -> str:
-    prompt_template = prompt_template_path.read_text(encoding="utf-8")
-    findings_json = format_findings(slither_report, mythril_report)
+    """Compact, contract-specific input for the executive overview."""
+    if findings is None:
+        findings = collect_findings(slither_report, mythril_report)
+    return json.dumps(
+        {
+            "tool_status": {
+                "slither": _tool_status(slither_report),
+                "mythril": _tool_status(mythril_report),
+            },
+            "findings": [
+                {
+                    "tool": finding.tool,
+                    "rule": finding.rule_id,
+                    "severity": finding.severity,
+                    "title": finding.title,
+                    "location": f"{finding.file}:{finding.line}" if finding.file else None,
+                    "detail": finding.message[:_MESSAGE_CHAR_LIMIT],
+                }
+                for finding in findings
+            ],
+        },
+        separators=(",", ":"),
+    )
 
-    client = openai.OpenAI(api_key=config.api_key)
-    response = client.responses.create(
-        model=config.model,
-        input=[
+
+def build_overview_request(
+    config: OpenAIConfig, prompt_template: str, findings_json: str
+) -> Dict[str, Any]:
+    """Request body for the Responses API, shared by the direct and batch paths."""
+    return {
+        "model": config.model,
+        "input": [
             {
                 "role": "system",
                 "content": prompt_template,
@@ -42,13 +88,201 @@ def generate_summary(
                 "content": findings_json,
             },
         ],
-        max_output_tokens=800,
-    )
+        "max_output_tokens": OVERVIEW_MAX_OUTPUT_TOKENS,
+    }
 
+
+def _response_text(response: Any) -> str:
     try:
         return response.output[0].content[0].text.strip()
     except (AttributeError, IndexError) as exc:
         raise RuntimeError("Unexpected response structure from OpenAI API.") from exc
 
 
-__all__ = ["generate_summary", "format_findings"]
+def _record_usage(response: Any) -> None:
+    span = current_span()
+    usage = getattr(response, "usage", None)
+    if span is None or usage is None:
+        return
+    span.set_attribute("gen_ai.usage.input_tokens", getattr(usage, "input_tokens", None))
+    span.set_attribute("gen_ai.usage.output_tokens", getattr(usage, "output_tokens", None))
+
+
+def _parse_explanations(text: str) -> Dict[str, str]:
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.strip("`")
+        text = text[text.find("{"):]
+    try:
+        parsed = json.loads(text)
+    except json.JSONDecodeError:
+        logger.warning("Discarding finding explanations: model did not return JSON")
+        return {}
+    if not isinstance(parsed, dict):
+        return {}
+    return {
+        str(key).lower(): str(value).strip()
+        for key, value in parsed.items()
+        if isinstance(value, str) and value.strip()
+    }
+
+
+def _generate_explanations(
+    config: OpenAIConfig,
+    client: openai.OpenAI,
+    prompt_text: str,
+    representatives: Dict[str, Finding],
+) -> Dict[str, str]:
+    with start_span(
+        "generate_explanations",
+        kind=SPAN_KIND_CLIENT,
+        **{
+            "gen_ai.system": "openai",
+            "gen_ai.request.model": config.model,
+            "explanations.chunk_size": len(representatives),
+        },
+    ):
+        response = client.responses.create(
+            model=config.model,
+            input=[
+                {"role": "system", "content": prompt_text},
+                {
+                    "role": "user",
+                    "content": json.dumps(
+                        [
+                            {
+                                "type": kind,
+                                "tool": finding.tool,
+                                "rule": finding.rule_id,
+                                "title": finding.title,
+                            }
+                            for kind, finding in representatives.items()
+                        ],
+                        separators=(",", ":"),
+                    ),
+                },
+            ],
+            max_output_tokens=_EXPLANATION_TOKENS_PER_TYPE * len(representatives),
+        )
+        _record_usage(response)
+    return {
+        kind: text
+        for kind, text in _parse_explanations(_response_text(response)).items()
+        if kind in representatives
+    }
+
+
+def explain_findings(
+    config: OpenAIConfig,
+    client: openai.OpenAI,
+    findings: List[Finding],
+) -> Dict[str, str]:
+    """Return ``{finding_type: explanation}``, generating only uncached types."""
+    representatives: Dict[str, Finding] = {}
+    for finding in findings:
+        representatives.setdefault(finding_type(finding), finding)
+    if not representatives:
+        return {}
+
+    prompt_text = EXPLANATION_PROMPT.read_text(encoding="utf-8")
+    digest = prompt_hash(prompt_text)
+    keys = {kind: cache_key(kind, config.model, digest) for kind in representatives}
+    cache = get_explanation_cache(config.explanation_cache_path)
+
+    with start_span("explain_findings", **{"explanations.requested": len(keys)}) as span:
+        cached = cache.get_many(keys.values())
+        explanations = {kind: cached[key] for kind, key in keys.items() if key in cached}
+        missing = [kind for kind in representatives if kind not in explanations]
+        span.set_attribute("explanations.cache_hits", len(explanations))
+        span.set_attribute("explanations.cache_misses", len(missing))
+        if not missing:
+            return explanations
+
+        chunks = [
+            {kind: representatives[kind] for kind in missing[i : i + _EXPLANATION_CHUNK_SIZE]}
+            for i in range(0, len(missing), _EXPLANATION_CHUNK_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=min(len(chunks), _EXPLANATION_MAX_PARALLEL)) as pool:
+            futures = [
+                pool.submit(
+                    copy_context().run, _generate_explanations, config, client, prompt_text, chunk
+                )
+                for chunk in chunks
+            ]
+            for future in futures:
+                try:
+                    generated = future.result()
+                except Exception as exc:
+                    logger.warning("Skipping a chunk of finding explanations: %s", exc)
+                    continue
+                cache.put_many({keys[kind]: (kind, text) for kind, text in generated.items()})
+                explanations.update(generated)
+        return explanations
+
+
+def compose_summary(
+    overview_markdown: str,
+    findings: List[Finding],
+    explanations: Dict[str, str],
+) -> str:
+    sections = [overview_markdown.strip()]
+    seen: set[str] = set()
+    for finding in findings:
+        kind = finding_type(finding)
+        if kind in seen or kind not in explanations:
+            continue
+        if not seen:
+            sections.append("## Finding Explanations")
+        seen.add(kind)
+        sections.append(f"### {finding.title} ({finding.tool} {finding.rule_id})")
+        sections.append(explanations[kind])
+    return "\n\n".join(sections)
+
+
+def generate_summary(
+    config: OpenAIConfig,
+    prompt_template_path: Path,
+    slither_report: Dict[str, Any],
+    mythril_report: Dict[str, Any],
+    findings: Optional[List[Finding]] = None,
+) -> str:
+    if findings is None:
+        findings = collect_findings(slither_report, mythril_report)
+    prompt_template = prompt_template_path.read_text(encoding="utf-8")
+    findings_json = format_findings(slither_report, mythril_report, findings)
+
+    client = openai.OpenAI(api_key=config.api_key)
+    with start_span("generate_summary", **{"gen_ai.request.model": config.model}):
+        # Explanations are optional extra content: fetch them alongside the overview
+        # so they add no latency, and never let them fail the audit.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            explanations_future = pool.submit(
+                copy_context().run, explain_findings, config, client, findings
+            )
+            with start_span(
+                "generate_overview",
+                kind=SPAN_KIND_CLIENT,
+                **{"gen_ai.system": "openai", "gen_ai.request.model": config.model},
+            ):
+                response = client.responses.create(
+                    **build_overview_request(config, prompt_template, findings_json)
+                )
+                _record_usage(response)
+                overview = _response_text(response)
+
+            try:
+                explanations = explanations_future.result()
+            except Exception as exc:
+                logger.warning("Finding explanations unavailable, using overview only: %s", exc)
+                explanations = {}
+
+        return compose_summary(overview, findings, explanations)
+
+
+__all__ = [
+    "build_overview_request",
+    "compose_summary",
+    "explain_findings",
+    "format_findings",
+    "generate_summary",
+]
@@ -1,7 +1,6 @@
 """High-level orchestration for automated smart contract audits."""
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
@@ -9,7 +8,9 @@ from app.config import AppConfig
 from app.services.ai_summary import generate_summary
 from app.services.mythril_scan import run_mythril
 from app.services.pdf_report import build_pdf
+from app.services.report_export import ExportedReports, collect_findings, export_reports
 from app.services.slither_scan import run_slither
+from app.utils.tracing import start_span
 
 
 def execute_audit(
@@ -17,33 +18,40 @@ def execute_audit(
     contract_path: Path,
     prompt_template: Path,
     output_pdf_path: Path,
-) -> Tuple[Dict[str, Any], Dict[str, Any], str, Path]:
-    slither_report = run_slither(contract_path)
-    mythril_report = run_mythril(contract_path)
-
-    summary_markdown = generate_summary(
-        config.openai,
-        prompt_template,
-        slither_report,
-        mythril_report,
-    )
-
-    raw_findings = [
-        ("Slither JSON", json.dumps(slither_report, indent=2)),
-        ("Mythril JSON", json.dumps(mythril_report, indent=2)),
-    ]
-
-    pdf_path = build_pdf(
-        output_pdf_path,
-        brand_name=config.brand_name,
-        brand_color=config.brand_color,
-        summary_markdown=summary_markdown,
-        raw_findings=raw_findings,
-        footer_text=config.report_footer,
-    )
-
-    summary_text = summary_markdown.replace("\n", " ")
-    return slither_report, mythril_report, summary_text, pdf_path
+) -> Tuple[Dict[str, Any], Dict[str, Any], str, Path, ExportedReports]:
+    with start_span("execute_audit", **{"audit.contract": contract_path.name}):
+        slither_report = run_slither(contract_path)
+        mythril_report = run_mythril(contract_path)
+
+        findings = collect_findings(slither_report, mythril_report)
+        summary_markdown = generate_summary(
+            config.openai,
+            prompt_template,
+            slither_report,
+            mythril_report,
+            findings=findings,
+        )
+
+        exports = export_reports(
+            output_pdf_path.parent,
+            findings,
+            slither_report,
+            mythril_report,
+            basename=output_pdf_path.stem,
+        )
+
+        pdf_path = build_pdf(
+            output_pdf_path,
+            brand_name=config.brand_name,
+            brand_color=config.brand_color,
+            summary_markdown=summary_markdown,
+            findings=findings,
+            footer_text=config.report_footer,
+            attachment_names=[path.name for path in exports.paths()],
+        )
+
+        summary_text = summary_markdown.replace("\n", " ")
+        return slither_report, mythril_report, summary_text, pdf_path, exports
 
 
 def prepare_pdf_path(workspace: Path) -> Path:
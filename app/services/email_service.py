@@ -5,8 +5,21 @@ import mimetypes
 import smtplib
 from email.message import EmailMessage
 from pathlib import Path
+from typing import Sequence
 
 from app.config import EmailConfig
+from app.utils.tracing import SPAN_KIND_CLIENT, start_span
+
+
+def _attach_file(msg: EmailMessage, path: Path, default_mime: str) -> None:
+    mime_type, _ = mimetypes.guess_type(path.name)
+    maintype, subtype = (mime_type or default_mime).split("/")
+    msg.add_attachment(
+        path.read_bytes(),
+        maintype=maintype,
+        subtype=subtype,
+        filename=path.name,
+    )
 
 
 def send_report(
@@ -14,6 +27,7 @@ def send_report(
     recipient_email: str,
     summary_text: str,
     pdf_path: Path,
+    attachments: Sequence[Path] = (),
 ) -> None:
     msg = EmailMessage()
     msg["Subject"] = "Your Affordable Smart Contract Audit Report"
@@ -25,21 +39,21 @@ def send_report(
         )
     )
 
-    mime_type, _ = mimetypes.guess_type(pdf_path.name)
-    maintype, subtype = (mime_type or "application/pdf").split("/")
-    msg.add_attachment(
-        pdf_path.read_bytes(),
-        maintype=maintype,
-        subtype=subtype,
-        filename=pdf_path.name,
-    )
-
-    with smtplib.SMTP(config.smtp_host, config.smtp_port, timeout=30) as smtp:
-        if config.use_tls:
-            smtp.starttls()
-        if config.username and config.password:
-            smtp.login(config.username, config.password)
-        smtp.send_message(msg)
+    _attach_file(msg, pdf_path, "application/pdf")
+    for attachment in attachments:
+        _attach_file(msg, attachment, "application/json")
+
+    with start_span(
+        "send_report",
+        kind=SPAN_KIND_CLIENT,
+        **{"server.address": config.smtp_host, "server.port": config.smtp_port},
+    ):
+        with smtplib.SMTP(config.smtp_host, config.smtp_port, timeout=30) as smtp:
+            if config.use_tls:
+                smtp.starttls()
+            if config.username and config.password:
+                smtp.login(config.username, config.password)
+            smtp.send_message(msg)
 
 
 __all__ = ["send_report"]
@@ -0,0 +1,85 @@
+"""Persistent cache of per-finding-type explanations generated by the AI model."""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable
+
+from app.services.report_export import Finding
+
+
+def finding_type(finding: Finding) -> str:
+    """Normalized finding type, e.g. ``slither:tx-origin`` or ``mythril:swc-107``."""
+    return f"{finding.tool.strip().lower()}:{finding.rule_id.strip().lower()}"
+
+
+def prompt_hash(prompt_text: str) -> str:
+    return hashlib.sha256(prompt_text.encode("utf-8")).hexdigest()[:16]
+
+
+def cache_key(normalized_type: str, model: str, prompt_digest: str) -> str:
+    return hashlib.sha256(f"{normalized_type}\0{model}\0{prompt_digest}".encode("utf-8")).hexdigest()
+
+
+class ExplanationCache:
+    """SQLite-backed key/value store shared by all sessions in the process."""
+
+    def __init__(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS explanations (
+                key TEXT PRIMARY KEY,
+                finding_type TEXT NOT NULL,
+                explanation TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        placeholders = ",".join("?" for _ in keys)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, explanation FROM explanations WHERE key IN ({placeholders})",
+                keys,
+            ).fetchall()
+        return dict(rows)
+
+    def put_many(self, entries: Dict[str, tuple[str, str]]) -> None:
+        """Store ``{key: (finding_type, explanation)}`` entries."""
+        if not entries:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO explanations (key, finding_type, explanation, created_at)"
+                " VALUES (?, ?, ?, ?)",
+                [(key, kind, text, now) for key, (kind, text) in entries.items()],
+            )
+            self._conn.commit()
+
+
+@lru_cache(maxsize=None)
+def get_explanation_cache(path: str) -> ExplanationCache:
+    return ExplanationCache(path)
+
+
+__all__ = [
+    "ExplanationCache",
+    "cache_key",
+    "finding_type",
+    "get_explanation_cache",
+    "prompt_hash",
+]
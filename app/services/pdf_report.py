@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Sequence
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
@@ -19,6 +19,9 @@ from reportlab.platypus import (  # type: ignore
 from markdown import markdown
 from bs4 import BeautifulSoup
 
+from app.services.report_export import Finding
+from app.utils.tracing import start_span
+
 
 BODY_FONT = "Helvetica"
 HEADER_FONT = "Helvetica-Bold"
@@ -32,7 +35,10 @@ def _markdown_to_paragraphs(markdown_text: str) -> Iterable[Paragraph]:
     styles["Normal"].fontSize = 11
     styles["Heading1"].fontName = HEADER_FONT
     styles["Heading1"].fontSize = 20
-    styles.add(ParagraphStyle(name="Heading2", parent=styles["Heading1"], fontSize=16))
+    # The sample sheet already defines Heading2; StyleSheet1.add would raise KeyError.
+    styles["Heading2"].fontName = HEADER_FONT
+    styles["Heading2"].fontSize = 16
+    styles["Heading2"].leading = 20
 
     for element in soup.children:
         if getattr(element, "name", None) is None:
@@ -53,8 +59,9 @@ def build_pdf(
     brand_name: str,
     brand_color: str,
     summary_markdown: str,
-    raw_findings: List[tuple[str, str]],
+    findings: Sequence[Finding],
     footer_text: str,
+    attachment_names: Sequence[str] = (),
 ) -> Path:
     doc = SimpleDocTemplate(
         str(output_path),
@@ -104,9 +111,40 @@ def build_pdf(
     elements.append(Paragraph("Detailed Findings", header_style))
     elements.append(Spacer(1, 0.1 * inch))
 
-    for title, content in raw_findings:
-        elements.append(Paragraph(title, ParagraphStyle(name="FindingTitle", fontName=HEADER_FONT, fontSize=14)))
-        elements.extend(_markdown_to_paragraphs(content))
+    if findings:
+        rows = [["Severity", "Tool", "Finding", "Location"]]
+        for finding in findings:
+            location = finding.file or "-"
+            if finding.file and finding.line:
+                location = f"{finding.file}:{finding.line}"
+            rows.append([finding.severity, finding.tool, finding.title, location])
+        findings_table = Table(rows, hAlign="LEFT", repeatRows=1)
+        findings_table.setStyle(
+            TableStyle(
+                [
+                    ("FONTNAME", (0, 0), (-1, -1), BODY_FONT),
+                    ("FONTNAME", (0, 0), (-1, 0), HEADER_FONT),
+                    ("FONTSIZE", (0, 0), (-1, -1), 9),
+                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.HexColor(brand_color)),
+                    ("LINEBELOW", (0, 0), (-1, 0), 0.5, colors.grey),
+                    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+                ]
+            )
+        )
+        elements.append(findings_table)
+    else:
+        elements.extend(_markdown_to_paragraphs("No findings were reported by the automated tools."))
+
+    if attachment_names:
+        elements.append(Spacer(1, 0.2 * inch))
+        elements.append(Paragraph("Appendix: Machine-Readable Results", header_style))
+        elements.append(Spacer(1, 0.1 * inch))
+        elements.extend(
+            _markdown_to_paragraphs(
+                "Full tool output is delivered alongside this report for CI integration:\n\n"
+                + "\n".join(f"- {name}" for name in attachment_names)
+            )
+        )
 
     def _footer(canvas, doc_):  # type: ignore
         canvas.saveState()
@@ -115,7 +153,8 @@ def build_pdf(
         canvas.drawString(50, 40, footer_text)
         canvas.restoreState()
 
-    doc.build(elements, onFirstPage=_footer, onLaterPages=_footer)
+    with start_span("build_pdf", **{"report.findings": len(findings)}):
+        doc.build(elements, onFirstPage=_footer, onLaterPages=_footer)
     return output_path
 
 
@@ -0,0 +1,216 @@
+"""Export audit findings as machine-readable SARIF and JSON reports."""
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.utils.tracing import start_span
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_VERSION = "2.1.0"
+SARIF_MIME_TYPE = "application/sarif+json"
+JSON_MIME_TYPE = "application/json"
+
+SEVERITY_ORDER = ["High", "Medium", "Low", "Informational"]
+
+# SARIF result level and GitHub code scanning "security-severity" score per severity.
+_SARIF_LEVELS = {
+    "High": ("error", "8.0"),
+    "Medium": ("warning", "5.5"),
+    "Low": ("note", "3.0"),
+    "Informational": ("note", "0.0"),
+}
+
+_TOOL_URIS = {
+    "Slither": "https://github.com/crytic/slither",
+    "Mythril": "https://github.com/ConsenSys/mythril",
+}
+
+
+@dataclass(frozen=True)
+class Finding:
+    tool: str
+    rule_id: str
+    title: str
+    severity: str
+    message: str
+    file: Optional[str] = None
+    line: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class ExportedReports:
+    sarif_path: Path
+    json_path: Path
+
+    def paths(self) -> List[Path]:
+        return [self.sarif_path, self.json_path]
+
+
+def _normalize_severity(value: Any) -> str:
+    text = str(value or "").strip().capitalize()
+    if text in _SARIF_LEVELS:
+        return text
+    # Slither reports gas findings as "Optimization"; treat them as informational.
+    return "Informational"
+
+
+def _slither_location(detector: Dict[str, Any]) -> tuple[Optional[str], Optional[int]]:
+    for element in detector.get("elements") or []:
+        mapping = element.get("source_mapping") or {}
+        filename = mapping.get("filename_relative") or mapping.get("filename_short")
+        lines = mapping.get("lines") or []
+        if filename:
+            return Path(filename).name, (lines[0] if lines else None)
+    return None, None
+
+
+def _slither_findings(report: Dict[str, Any]) -> Iterable[Finding]:
+    detectors = (report.get("results") or {}).get("detectors") or []
+    for detector in detectors:
+        check = detector.get("check") or "slither-finding"
+        file, line = _slither_location(detector)
+        yield Finding(
+            tool="Slither",
+            rule_id=check,
+            title=check.replace("-", " ").capitalize(),
+            severity=_normalize_severity(detector.get("impact")),
+            message=(detector.get("description") or check).strip(),
+            file=file,
+            line=line,
+        )
+
+
+def _mythril_findings(report: Dict[str, Any]) -> Iterable[Finding]:
+    for issue in report.get("issues") or []:
+        swc_id = issue.get("swc-id")
+        filename = issue.get("filename")
+        yield Finding(
+            tool="Mythril",
+            rule_id=f"SWC-{swc_id}" if swc_id else "mythril-finding",
+            title=issue.get("title") or "Mythril finding",
+            severity=_normalize_severity(issue.get("severity")),
+            message=(issue.get("description") or issue.get("title") or "").strip(),
+            file=Path(filename).name if filename else None,
+            line=issue.get("lineno"),
+        )
+
+
+def collect_findings(
+    slither_report: Dict[str, Any], mythril_report: Dict[str, Any]
+) -> List[Finding]:
+    findings = [*_slither_findings(slither_report), *_mythril_findings(mythril_report)]
+    findings.sort(key=lambda finding: SEVERITY_ORDER.index(finding.severity))
+    return findings
+
+
+def _sarif_result(finding: Finding) -> Dict[str, Any]:
+    level = _SARIF_LEVELS[finding.severity][0]
+    result: Dict[str, Any] = {
+        "ruleId": finding.rule_id,
+        "level": level,
+        "message": {"text": finding.message or finding.title},
+    }
+    if finding.file:
+        physical_location: Dict[str, Any] = {"artifactLocation": {"uri": finding.file}}
+        if finding.line:
+            physical_location["region"] = {"startLine": finding.line}
+        result["locations"] = [{"physicalLocation": physical_location}]
+    return result
+
+
+def _sarif_run(tool: str, findings: List[Finding]) -> Dict[str, Any]:
+    # GitHub code scanning only reads "security-severity" from the rule, and tools can
+    # report one rule at several severities: score each rule by its most severe result.
+    rule_severity: Dict[str, str] = {}
+    rules: Dict[str, Dict[str, Any]] = {}
+    for finding in findings:
+        current = rule_severity.get(finding.rule_id)
+        if current is None or SEVERITY_ORDER.index(finding.severity) < SEVERITY_ORDER.index(current):
+            rule_severity[finding.rule_id] = finding.severity
+        rules.setdefault(
+            finding.rule_id,
+            {
+                "id": finding.rule_id,
+                "name": finding.title,
+                "shortDescription": {"text": finding.title},
+            },
+        )
+    for rule_id, rule in rules.items():
+        rule["properties"] = {
+            "tags": ["security"],
+            "security-severity": _SARIF_LEVELS[rule_severity[rule_id]][1],
+        }
+    return {
+        "tool": {
+            "driver": {
+                "name": tool,
+                "informationUri": _TOOL_URIS[tool],
+                "rules": list(rules.values()),
+            }
+        },
+        "results": [_sarif_result(finding) for finding in findings],
+    }
+
+
+def build_sarif(findings: List[Finding]) -> Dict[str, Any]:
+    return {
+        "$schema": SARIF_SCHEMA,
+        "version": SARIF_VERSION,
+        "runs": [
+            _sarif_run(tool, [finding for finding in findings if finding.tool == tool])
+            for tool in _TOOL_URIS
+        ],
+    }
+
+
+def build_json_report(
+    findings: List[Finding],
+    slither_report: Dict[str, Any],
+    mythril_report: Dict[str, Any],
+) -> Dict[str, Any]:
+    counts = {severity: 0 for severity in SEVERITY_ORDER}
+    for finding in findings:
+        counts[finding.severity] += 1
+    return {
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "severity_counts": counts,
+        "findings": [asdict(finding) for finding in findings],
+        "raw": {"slither": slither_report, "mythril": mythril_report},
+    }
+
+
+def export_reports(
+    output_dir: Path,
+    findings: List[Finding],
+    slither_report: Dict[str, Any],
+    mythril_report: Dict[str, Any],
+    basename: str = "audit-report",
+) -> ExportedReports:
+    """Write SARIF and compact JSON reports for ``findings`` into ``output_dir``."""
+    sarif_path = output_dir / f"{basename}.sarif"
+    json_path = output_dir / f"{basename}.json"
+    compact = {"separators": (",", ":"), "ensure_ascii": False}
+
+    with start_span("export_reports", **{"report.findings": len(findings)}):
+        sarif_path.write_text(json.dumps(build_sarif(findings), **compact), encoding="utf-8")
+        json_path.write_text(
+            json.dumps(build_json_report(findings, slither_report, mythril_report), **compact),
+            encoding="utf-8",
+        )
+    return ExportedReports(sarif_path=sarif_path, json_path=json_path)
+
+
+__all__ = [
+    "Finding",
+    "ExportedReports",
+    "collect_findings",
+    "build_sarif",
+    "build_json_report",
+    "export_reports",
+    "SARIF_MIME_TYPE",
+    "JSON_MIME_TYPE",
+]
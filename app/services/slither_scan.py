@@ -5,6 +5,8 @@ import json
 import subprocess
 from pathlib import Path
 
+from app.utils.tracing import start_span, subprocess_env
+
 
 class SlitherNotInstalledError(RuntimeError):
     """Raised when Slither is not available in the runtime environment."""
@@ -18,32 +20,35 @@ def run_slither(contract_path: Path) -> dict:
     contract_path: Path
         Absolute path to the Solidity contract.
     """
-    try:
-        result = subprocess.run(
-            [
-                "slither",
-                str(contract_path),
-                "--json",
-                "-",
-                "--detect",
-                "arbitrary-send,tx-origin,controlled-delegatecall,unchecked-transfer",
-            ],
-            capture_output=True,
-            check=False,
-            text=True,
-        )
-    except FileNotFoundError as exc:  # pragma: no cover - depends on environment
-        raise SlitherNotInstalledError("Slither is not installed in the container.") from exc
-
-    if result.returncode not in {0, 255}:  # 255 indicates informational/warnings in Slither
-        raise RuntimeError(
-            f"Slither scan failed (code {result.returncode}): {result.stderr.strip()}"
-        )
-
-    try:
-        return json.loads(result.stdout or "{}")
-    except json.JSONDecodeError as exc:
-        raise RuntimeError("Failed to parse Slither output as JSON.") from exc
+    with start_span("slither", **{"process.executable.name": "slither"}) as span:
+        try:
+            result = subprocess.run(
+                [
+                    "slither",
+                    str(contract_path),
+                    "--json",
+                    "-",
+                    "--detect",
+                    "arbitrary-send,tx-origin,controlled-delegatecall,unchecked-transfer",
+                ],
+                capture_output=True,
+                check=False,
+                text=True,
+                env=subprocess_env(),
+            )
+        except FileNotFoundError as exc:  # pragma: no cover - depends on environment
+            raise SlitherNotInstalledError("Slither is not installed in the container.") from exc
+
+        span.set_attribute("process.exit_code", result.returncode)
+        if result.returncode not in {0, 255}:  # 255 indicates informational/warnings in Slither
+            raise RuntimeError(
+                f"Slither scan failed (code {result.returncode}): {result.stderr.strip()}"
+            )
+
+        try:
+            return json.loads(result.stdout or "{}")
+        except json.JSONDecodeError as exc:
+            raise RuntimeError("Failed to parse Slither output as JSON.") from exc
 
 
 __all__ = ["run_slither", "SlitherNotInstalledError"]
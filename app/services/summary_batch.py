@@ -0,0 +1,135 @@
+"""Submit executive overviews for queued audits through the OpenAI Batch API.
+
+Use this path when an audit's report does not need to go out immediately: the
+overview requests for many audits are uploaded as one JSONL file and completed
+asynchronously at batch pricing. Per-finding explanations still come from the
+shared explanation cache (see :func:`app.services.ai_summary.explain_findings`),
+so only the contract-specific overview is billed per audit.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+import openai
+
+from app.config import OpenAIConfig
+from app.services.ai_summary import build_overview_request, format_findings
+from app.services.report_export import collect_findings
+from app.utils.tracing import SPAN_KIND_CLIENT, start_span
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/responses"
+BATCH_COMPLETION_WINDOW = "24h"
+
+_PENDING_STATUSES = {"validating", "in_progress", "finalizing", "cancelling"}
+
+
+class BatchSummaryError(RuntimeError):
+    """Raised when an overview batch fails or returns unusable results."""
+
+
+@dataclass(frozen=True)
+class QueuedAudit:
+    audit_id: str
+    slither_report: Dict[str, Any]
+    mythril_report: Dict[str, Any]
+
+
+def build_batch_file(
+    config: OpenAIConfig,
+    prompt_template_path: Path,
+    audits: Sequence[QueuedAudit],
+) -> bytes:
+    prompt_template = prompt_template_path.read_text(encoding="utf-8")
+    lines = []
+    for audit in audits:
+        findings = collect_findings(audit.slither_report, audit.mythril_report)
+        findings_json = format_findings(audit.slither_report, audit.mythril_report, findings)
+        lines.append(
+            json.dumps(
+                {
+                    "custom_id": audit.audit_id,
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": build_overview_request(config, prompt_template, findings_json),
+                },
+                separators=(",", ":"),
+            )
+        )
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def submit_overview_batch(
+    config: OpenAIConfig,
+    prompt_template_path: Path,
+    audits: Sequence[QueuedAudit],
+) -> str:
+    """Upload overview requests for ``audits`` and return the batch ID."""
+    if not audits:
+        raise BatchSummaryError("No queued audits to submit.")
+    client = openai.OpenAI(api_key=config.api_key)
+    with start_span("submit_overview_batch", kind=SPAN_KIND_CLIENT, **{"batch.size": len(audits)}):
+        batch_file = client.files.create(
+            file=("audit-overviews.jsonl", build_batch_file(config, prompt_template_path, audits)),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW,
+            metadata={"product": "affordable-smart-contract-audit"},
+        )
+    return batch.id
+
+
+def _overview_text(body: Dict[str, Any]) -> str:
+    for item in body.get("output") or []:
+        for content in item.get("content") or []:
+            if content.get("type") == "output_text" and content.get("text"):
+                return content["text"].strip()
+    raise BatchSummaryError("Unexpected response structure in batch output.")
+
+
+def collect_overview_batch(config: OpenAIConfig, batch_id: str) -> Optional[Dict[str, str]]:
+    """Return ``{audit_id: overview_markdown}`` once the batch is done, else ``None``.
+
+    Audits whose request failed or returned no overview text are omitted, so callers
+    can fall back to :func:`app.services.ai_summary.generate_summary` for those
+    audits only.
+    """
+    client = openai.OpenAI(api_key=config.api_key)
+    with start_span("collect_overview_batch", kind=SPAN_KIND_CLIENT, **{"batch.id": batch_id}):
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in _PENDING_STATUSES:
+            return None
+        if batch.status != "completed" or not batch.output_file_id:
+            raise BatchSummaryError(f"Overview batch {batch_id} ended with status {batch.status}.")
+        output = client.files.content(batch.output_file_id).text
+
+    overviews: Dict[str, str] = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            continue
+        try:
+            overviews[record["custom_id"]] = _overview_text(response.get("body") or {})
+        except BatchSummaryError:
+            logger.warning("Skipping batch record %s without overview text", record.get("custom_id"))
+    return overviews
+
+
+__all__ = [
+    "BatchSummaryError",
+    "QueuedAudit",
+    "build_batch_file",
+    "collect_overview_batch",
+    "submit_overview_batch",
+]
@@ -1,6 +1,7 @@
 """File system utilities for audit workspaces."""
 from __future__ import annotations
 
+import os
 import secrets
 import shutil
 from pathlib import Path
@@ -11,8 +12,16 @@ class FileValidationError(ValueError):
     """Raised when an uploaded file fails validation."""
 
 
+# Prefix that marks directories created by this app, so cleanup never touches anything else.
+WORKSPACE_PREFIX = "audit-ws-"
+
+
 def _generate_workspace_name() -> str:
-    return secrets.token_urlsafe(12)
+    return f"{WORKSPACE_PREFIX}{secrets.token_urlsafe(12)}"
+
+
+def is_workspace(path: Path) -> bool:
+    return path.name.startswith(WORKSPACE_PREFIX) and path.is_dir() and not path.is_symlink()
 
 
 def create_workspace(root: str) -> Path:
@@ -33,18 +42,44 @@ def persist_contract(uploaded_file: BinaryIO, destination: Path) -> Path:
     return destination_path
 
 
+_OVERWRITE_CHUNK_SIZE = 1024 * 1024
+
+
+def _overwrite_file(path: Path) -> None:
+    try:
+        remaining = path.stat().st_size
+        with open(path, "r+b", buffering=0) as handle:
+            while remaining > 0:
+                chunk = min(remaining, _OVERWRITE_CHUNK_SIZE)
+                handle.write(os.urandom(chunk))
+                remaining -= chunk
+            os.fsync(handle.fileno())
+    except OSError:
+        pass
+
+
 def secure_delete(path: Path) -> None:
-    if path.is_file():
-        path.write_bytes(b"")
+    """Overwrite every regular file under ``path`` with random bytes, then remove it."""
+    if path.is_symlink():
+        path.unlink(missing_ok=True)
+    elif path.is_file():
+        _overwrite_file(path)
         path.unlink(missing_ok=True)
     elif path.is_dir():
+        for current, _, files in os.walk(path):
+            for name in files:
+                file_path = Path(current) / name
+                if not file_path.is_symlink():
+                    _overwrite_file(file_path)
         shutil.rmtree(path, ignore_errors=True)
 
 
 __all__ = [
     "create_workspace",
+    "is_workspace",
     "validate_contract_filename",
     "persist_contract",
     "secure_delete",
     "FileValidationError",
+    "WORKSPACE_PREFIX",
 ]
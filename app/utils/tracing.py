@@ -0,0 +1,230 @@
+"""Lightweight span tracing for the audit pipeline.
+
+Spans are grouped into one trace per audit and, once the root span ends, the
+whole trace is appended as a single OTLP/JSON ``ExportTraceServiceRequest`` line
+to a rotating local file. No collector or OpenTelemetry SDK is required; the
+files can be inspected with ``scripts/trace_viewer.py`` or replayed into any
+OTLP-compatible backend.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.config import TracingConfig
+
+SERVICE_NAME = "affordable-smart-contract-audits"
+TRACEPARENT_ENV = "TRACEPARENT"
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+
+_STATUS_UNSET = 0
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: Optional[str]
+    kind: int = SPAN_KIND_INTERNAL
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    status_code: int = _STATUS_UNSET
+    status_message: str = ""
+    _finished: List["Span"] = field(default_factory=list, repr=False)
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.status_code = _STATUS_ERROR
+        self.status_message = str(exc)
+        self.events.append(
+            {
+                "timeUnixNano": str(time.time_ns()),
+                "name": "exception",
+                "attributes": _otlp_attributes(
+                    {"exception.type": type(exc).__name__, "exception.message": str(exc)}
+                ),
+            }
+        )
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or time.time_ns()),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": self.status_code, "message": self.status_message},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.events:
+            span["events"] = self.events
+        return span
+
+
+class _FileTraceExporter:
+    def __init__(self, config: TracingConfig) -> None:
+        path = Path(config.file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handler = RotatingFileHandler(
+            path,
+            maxBytes=config.max_bytes,
+            backupCount=config.backup_count,
+            encoding="utf-8",
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._handler = handler
+        self._logger = logging.Logger("app.traces")
+        self._logger.addHandler(handler)
+
+    def close(self) -> None:
+        self._logger.removeHandler(self._handler)
+        self._handler.close()
+
+    def export(self, spans: List[Span]) -> None:
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes(
+                            {"service.name": SERVICE_NAME, "process.pid": os.getpid()}
+                        )
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        self._logger.info(json.dumps(request, separators=(",", ":")))
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("audit_current_span", default=None)
+_exporter: Optional[_FileTraceExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def configure_tracing(config: TracingConfig) -> None:
+    """Install the rotating file exporter. Without it spans are timed but discarded."""
+    global _exporter
+    with _exporter_lock:
+        if _exporter is not None:
+            _exporter.close()
+            _exporter = None
+        if not config.enabled:
+            return
+        try:
+            _exporter = _FileTraceExporter(config)
+        except OSError as exc:
+            logging.getLogger(__name__).warning(
+                "Tracing disabled, cannot write %s: %s", config.file_path, exc
+            )
+
+
+@contextmanager
+def start_span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Iterator[Span]:
+    """Open a span as a child of the current one, or as the root of a new trace."""
+    parent = _current_span.get()
+    span = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else secrets.token_hex(16),
+        span_id=secrets.token_hex(8),
+        parent_span_id=parent.span_id if parent else None,
+        kind=kind,
+    )
+    if parent is not None:
+        span._finished = parent._finished
+    for key, value in attributes.items():
+        span.set_attribute(key, value)
+
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.record_exception(exc)
+        raise
+    else:
+        if span.status_code == _STATUS_UNSET:
+            span.status_code = _STATUS_OK
+    finally:
+        span.end_ns = time.time_ns()
+        _current_span.reset(token)
+        span._finished.append(span)
+        if parent is None and _exporter is not None:
+            try:
+                _exporter.export(span._finished)
+            except Exception:  # pragma: no cover - tracing must never break an audit
+                logging.getLogger(__name__).exception("Failed to export trace %s", span.trace_id)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    span = _current_span.get()
+    return span.trace_id if span else None
+
+
+def subprocess_env() -> Dict[str, str]:
+    """Return the process environment with a W3C ``TRACEPARENT`` for the current span."""
+    env = dict(os.environ)
+    span = _current_span.get()
+    if span is not None:
+        env[TRACEPARENT_ENV] = span.traceparent
+    return env
+
+
+__all__ = [
+    "Span",
+    "SPAN_KIND_CLIENT",
+    "SPAN_KIND_INTERNAL",
+    "configure_tracing",
+    "current_span",
+    "current_trace_id",
+    "start_span",
+    "subprocess_env",
+]
@@ -0,0 +1,168 @@
+"""Workspace lifecycle management: tmpfs staging, background cleanup and stale sweeps."""
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Set
+
+from app.config import WorkspaceConfig
+from app.utils.file_manager import create_workspace, is_workspace, secure_delete
+
+logger = logging.getLogger(__name__)
+
+# Headroom kept free on the tmpfs mount so a single upload cannot exhaust it.
+_TMPFS_RESERVE_BYTES = 16 * 1024 * 1024
+
+
+def _workspaces(root: Path) -> List[Path]:
+    try:
+        return [entry for entry in root.iterdir() if is_workspace(entry)]
+    except OSError:
+        return []
+
+
+def _workspaces_size(root: Path) -> int:
+    total = 0
+    for workspace in _workspaces(root):
+        for current, _, files in os.walk(workspace):
+            for name in files:
+                try:
+                    total += (Path(current) / name).lstat().st_size
+                except OSError:
+                    continue
+    return total
+
+
+class WorkspaceManager:
+    """Hand out audit workspaces and delete them off the request path.
+
+    Workspaces are staged on ``tmpfs_root`` while its usage stays under the
+    configured quota and fall back to ``storage_root`` otherwise. Released
+    workspaces are securely deleted by a daemon thread, which also sweeps both
+    roots for workspaces older than the TTL at startup and every sweep interval.
+    """
+
+    def __init__(self, config: WorkspaceConfig) -> None:
+        self._config = config
+        self._disk_root = Path(config.storage_root)
+        self._tmpfs_root = self._prepare_tmpfs_root(config.tmpfs_root)
+        self._active: Set[Path] = set()
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[Path]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _prepare_tmpfs_root(root: Optional[str]) -> Optional[Path]:
+        if not root:
+            return None
+        path = Path(root)
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            logger.warning("tmpfs staging disabled, cannot create %s: %s", path, exc)
+            return None
+        if not os.access(path, os.W_OK):
+            logger.warning("tmpfs staging disabled, %s is not writable", path)
+            return None
+        return path
+
+    @property
+    def roots(self) -> list[Path]:
+        return [root for root in (self._tmpfs_root, self._disk_root) if root is not None]
+
+    def start(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._worker = threading.Thread(
+            target=self._run, name="workspace-cleanup", daemon=True
+        )
+        self._worker.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        if self._worker is None:
+            return
+        self._queue.put(None)
+        self._worker.join(timeout)
+        self._worker = None
+
+    def _tmpfs_has_room(self) -> bool:
+        if self._tmpfs_root is None:
+            return False
+        try:
+            free_bytes = shutil.disk_usage(self._tmpfs_root).free
+        except OSError:
+            return False
+        if free_bytes < _TMPFS_RESERVE_BYTES:
+            return False
+        used = _workspaces_size(self._tmpfs_root)
+        return used + _TMPFS_RESERVE_BYTES <= self._config.tmpfs_quota_bytes
+
+    def create(self) -> Path:
+        with self._lock:
+            root = self._tmpfs_root if self._tmpfs_has_room() else self._disk_root
+            workspace = create_workspace(str(root))
+            self._active.add(workspace)
+        return workspace
+
+    def release(self, workspace: Path) -> None:
+        """Schedule ``workspace`` for secure deletion on the background thread."""
+        with self._lock:
+            self._active.discard(workspace)
+        if self._worker is None or not self._worker.is_alive():
+            secure_delete(workspace)
+            return
+        self._queue.put(workspace)
+
+    def sweep(self) -> int:
+        """Securely delete inactive workspaces older than the TTL. Returns the count removed.
+
+        Only directories created by :func:`create_workspace` are considered, so a
+        misconfigured root such as ``/tmp`` never loses data owned by anything else.
+        """
+        cutoff = time.time() - self._config.ttl_seconds
+        removed = 0
+        for root in self.roots:
+            for candidate in _workspaces(root):
+                with self._lock:
+                    if candidate in self._active:
+                        continue
+                try:
+                    if candidate.stat().st_mtime > cutoff:
+                        continue
+                except OSError:
+                    continue
+                secure_delete(candidate)
+                removed += 1
+        if removed:
+            logger.info("Swept %d stale audit workspace(s)", removed)
+        return removed
+
+    def _run(self) -> None:
+        self._safely(self.sweep)
+        next_sweep = time.monotonic() + self._config.sweep_interval_seconds
+        while True:
+            timeout = max(0.0, next_sweep - time.monotonic())
+            try:
+                workspace = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._safely(self.sweep)
+                next_sweep = time.monotonic() + self._config.sweep_interval_seconds
+                continue
+            if workspace is None:
+                return
+            self._safely(secure_delete, workspace)
+
+    @staticmethod
+    def _safely(func: Callable[..., Any], *args: Any) -> None:
+        try:
+            func(*args)
+        except Exception:  # pragma: no cover - keep the worker alive
+            logger.exception("Workspace cleanup failed")
+
+
+__all__ = ["WorkspaceManager"]
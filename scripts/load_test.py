@@ -0,0 +1,775 @@
+"""Load-test the checkout-to-email flow with simulated concurrent customers.
+
+Each virtual user repeatedly runs the same stages a real customer triggers:
+Stripe checkout creation, payment verification through ``_process_success_flow``,
+``execute_audit`` (real Slither and Mythril subprocesses) and ``send_report``.
+Stripe, OpenAI and SMTP are replaced by local fakes with configurable latency so
+only this container's capacity is measured.
+
+Load is applied in steps: the user count grows by ``--step-users`` and each
+count is held for ``--step-seconds``. Only flows that start and finish inside a
+step are attributed to it, and a step needs ``--min-samples`` such flows before
+it can count as within the SLO. Per-stage latency percentiles, error rates and
+host saturation are recorded, and a capacity report is printed and optionally
+written as JSON.
+
+Usage::
+
+    python scripts/load_test.py --users 8 --step-users 2 --step-seconds 1200
+    python scripts/load_test.py --users 4 --contract MyToken.sol --output capacity.json
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import math
+import os
+import secrets
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+STAGES = ["checkout", "payment", "audit", "email"]
+
+EXAMPLE_CONTRACT = b"""// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.20;
+
+contract ExampleToken {
+    mapping(address => uint256) public balanceOf;
+    address public owner;
+
+    constructor() {
+        owner = msg.sender;
+        balanceOf[msg.sender] = 1_000_000 ether;
+    }
+
+    function transfer(address to, uint256 amount) external {
+        require(balanceOf[msg.sender] >= amount, "insufficient");
+        balanceOf[msg.sender] -= amount;
+        balanceOf[to] += amount;
+    }
+
+    function withdrawAll() external {
+        (bool ok, ) = owner.call{value: address(this).balance}("");
+        require(ok, "withdraw failed");
+    }
+}
+"""
+
+
+# --------------------------------------------------------------------------- fakes
+
+
+class _FakeAPIHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send_json(self, payload: Dict[str, Any], status: int = 200) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeStripeHandler(_FakeAPIHandler):
+    """Implements the two Checkout Session calls made by ``app.services.payments``."""
+
+    def do_POST(self) -> None:  # noqa: N802 - stdlib naming
+        time.sleep(self.latency)
+        if urlparse(self.path).path != "/v1/checkout/sessions":
+            self._send_json({"error": {"message": "not found"}}, status=404)
+            return
+        form = parse_qs(self._read_body().decode("utf-8"))
+        session_id = f"cs_test_{secrets.token_hex(12)}"
+        self._send_json(
+            {
+                "id": session_id,
+                "object": "checkout.session",
+                "customer_email": form.get("customer_email", [""])[0],
+                "payment_status": "unpaid",
+                "url": f"https://checkout.stripe.test/pay/{session_id}",
+            }
+        )
+
+    def do_GET(self) -> None:  # noqa: N802 - stdlib naming
+        time.sleep(self.latency)
+        path = urlparse(self.path).path
+        prefix = "/v1/checkout/sessions/"
+        if not path.startswith(prefix):
+            self._send_json({"error": {"message": "not found"}}, status=404)
+            return
+        self._send_json(
+            {
+                "id": path[len(prefix):],
+                "object": "checkout.session",
+                "payment_status": "paid",
+            }
+        )
+
+
+class FakeOpenAIHandler(_FakeAPIHandler):
+    """Answers Responses API calls with canned overviews and explanation JSON."""
+
+    def do_POST(self) -> None:  # noqa: N802 - stdlib naming
+        time.sleep(self.latency)
+        request = json.loads(self._read_body() or b"{}")
+        user_content = request.get("input", [{}])[-1].get("content", "")
+        try:
+            parsed = json.loads(user_content)
+        except (TypeError, ValueError):
+            parsed = None
+        if isinstance(parsed, list):
+            text = json.dumps(
+                {item["type"]: f"Load-test explanation for {item['type']}." for item in parsed}
+            )
+        else:
+            text = "# Executive Overview\n\n- Load-test overview generated by a fake endpoint."
+        self._send_json(
+            {
+                "id": f"resp_{secrets.token_hex(8)}",
+                "object": "response",
+                "created_at": int(time.time()),
+                "model": request.get("model", "fake"),
+                "status": "completed",
+                "output": [
+                    {
+                        "type": "message",
+                        "id": f"msg_{secrets.token_hex(8)}",
+                        "role": "assistant",
+                        "status": "completed",
+                        "content": [{"type": "output_text", "text": text, "annotations": []}],
+                    }
+                ],
+                "usage": {
+                    "input_tokens": len(user_content) // 4,
+                    "output_tokens": len(text) // 4,
+                    "total_tokens": (len(user_content) + len(text)) // 4,
+                },
+            }
+        )
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP server that accepts and discards every message."""
+
+    latency = 0.0
+    received = 0
+    _lock = threading.Lock()
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+    def handle(self) -> None:
+        self._reply("220 load-test SMTP sink ready")
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            command = raw.decode("utf-8", "replace").strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self._reply("250 load-test")
+            elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                self._reply("250 OK")
+            elif command == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b".\n", b""):
+                    pass
+                time.sleep(self.latency)
+                with self._lock:
+                    SMTPSinkHandler.received += 1
+                self._reply("250 OK queued")
+            elif command == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class _ThreadingTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def _serve(server: socketserver.BaseServer) -> None:
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+
+def _with_latency(handler: type, latency: float) -> type:
+    return type(handler.__name__, (handler,), {"latency": latency})
+
+
+# ----------------------------------------------------------------- streamlit shim
+
+
+class _UserState(threading.local):
+    def __init__(self) -> None:
+        self.query_params: Dict[str, str] = {}
+        self.session_state: Dict[str, Any] = {}
+        self.warnings: List[str] = []
+
+
+class StreamlitShim:
+    """Per-thread stand-in for the ``st`` calls made by ``_process_success_flow``.
+
+    Each virtual user thread gets its own query params and session state, the way
+    each browser tab gets its own Streamlit session.
+    """
+
+    def __init__(self) -> None:
+        self._state = _UserState()
+
+    @property
+    def session_state(self) -> Dict[str, Any]:
+        return self._state.session_state
+
+    def set_query_params(self, **params: str) -> None:
+        self._state.query_params = dict(params)
+
+    def experimental_get_query_params(self) -> Dict[str, List[str]]:
+        return {key: [value] for key, value in self._state.query_params.items()}
+
+    def experimental_set_query_params(self, **params: str) -> None:
+        self.set_query_params(**params)
+
+    def warning(self, message: str) -> None:
+        self._state.warnings.append(str(message))
+
+    def pop_warnings(self) -> List[str]:
+        warnings, self._state.warnings = self._state.warnings, []
+        return warnings
+
+
+# ------------------------------------------------------------------- measurement
+
+
+@dataclass
+class FlowResult:
+    started_at: float
+    finished_at: float = 0.0
+    durations: Dict[str, float] = field(default_factory=dict)
+    failed_stage: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def total(self) -> float:
+        return sum(self.durations.values())
+
+
+class ResourceSampler:
+    """Samples host load, memory and scanner processes alongside stage concurrency."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.samples: List[Dict[str, Any]] = []
+        self.in_flight: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+
+    def enter(self, stage: str) -> None:
+        with self._lock:
+            self.in_flight[stage] += 1
+
+    def exit(self, stage: str) -> None:
+        with self._lock:
+            self.in_flight[stage] -= 1
+
+    @staticmethod
+    def _memory_used_pct() -> Optional[float]:
+        try:
+            with open("/proc/meminfo", encoding="ascii") as handle:
+                info = {line.split(":")[0]: int(line.split()[1]) for line in handle}
+            return 100.0 * (1 - info["MemAvailable"] / info["MemTotal"])
+        except (OSError, KeyError, ValueError, ZeroDivisionError):
+            return None
+
+    @staticmethod
+    def _scanner_processes() -> Optional[int]:
+        if not os.path.isdir("/proc"):
+            return None
+        count = 0
+        for pid in os.listdir("/proc"):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f"/proc/{pid}/cmdline", "rb") as handle:
+                    argv0 = handle.read().split(b"\0", 2)[:2]
+            except OSError:
+                continue
+            if any(Path(part.decode("utf-8", "replace")).name in {"myth", "slither", "solc"} for part in argv0):
+                count += 1
+        return count
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                in_flight = dict(self.in_flight)
+            self.samples.append(
+                {
+                    "t": time.monotonic(),
+                    "load1": os.getloadavg()[0] if hasattr(os, "getloadavg") else None,
+                    "memory_used_pct": self._memory_used_pct(),
+                    "scanner_processes": self._scanner_processes(),
+                    "in_flight": in_flight,
+                }
+            )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+# ------------------------------------------------------------------------ runner
+
+
+class LoadTest:
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.results: List[FlowResult] = []
+        self._results_lock = threading.Lock()
+        self.steps: List[Tuple[int, float, float]] = []
+        self._stop = threading.Event()
+        self.sampler = ResourceSampler(args.sample_interval)
+        self.contract_bytes = Path(args.contract).read_bytes() if args.contract else EXAMPLE_CONTRACT
+        self.workdir = Path(tempfile.mkdtemp(prefix="audit-load-test-"))
+        self.shim = StreamlitShim()
+        self.main: Any = None
+        self.config: Any = None
+        self.workspaces: Any = None
+
+    def _start_fakes(self) -> Dict[str, int]:
+        stripe_server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), _with_latency(FakeStripeHandler, self.args.stripe_latency)
+        )
+        openai_server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), _with_latency(FakeOpenAIHandler, self.args.openai_latency)
+        )
+        smtp_server = _ThreadingTCPServer(
+            ("127.0.0.1", 0), _with_latency(SMTPSinkHandler, self.args.smtp_latency)
+        )
+        for server in (stripe_server, openai_server, smtp_server):
+            _serve(server)
+        return {
+            "stripe": stripe_server.server_address[1],
+            "openai": openai_server.server_address[1],
+            "smtp": smtp_server.server_address[1],
+        }
+
+    def _build_config(self, ports: Dict[str, int]) -> Any:
+        from app.config import (
+            AppConfig,
+            EmailConfig,
+            OpenAIConfig,
+            StripeConfig,
+            TracingConfig,
+            WorkspaceConfig,
+        )
+
+        storage_root = self.workdir / "workspaces"
+        storage_root.mkdir()
+        return AppConfig(
+            storage_root=str(storage_root),
+            workspace=WorkspaceConfig(
+                storage_root=str(storage_root),
+                tmpfs_root=os.getenv("AUDIT_TMPFS_ROOT") or None,
+                tmpfs_quota_bytes=int(os.getenv("AUDIT_TMPFS_QUOTA_MB", "256")) * 1024 * 1024,
+                ttl_seconds=3600,
+                sweep_interval_seconds=300,
+            ),
+            stripe=StripeConfig(
+                secret_key="sk_test_load",
+                price_id=None,
+                success_url="https://load-test.local",
+                cancel_url="https://load-test.local/cancel",
+            ),
+            email=EmailConfig(
+                smtp_host="127.0.0.1",
+                smtp_port=ports["smtp"],
+                username="",
+                password="",
+                sender_email="audits@load-test.local",
+                sender_name="Load Test",
+                use_tls=False,
+            ),
+            openai=OpenAIConfig(
+                api_key="sk-load-test",
+                model="load-test-model",
+                explanation_cache_path=str(self.workdir / "explanations.sqlite3"),
+            ),
+            tracing=TracingConfig(
+                enabled=self.args.trace,
+                file_path=str(self.workdir / "traces.jsonl"),
+                max_bytes=20 * 1024 * 1024,
+                backup_count=1,
+            ),
+        )
+
+    def _run_stage(
+        self, result: FlowResult, stage: str, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        self.sampler.enter(stage)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as exc:
+            result.failed_stage = stage
+            result.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            result.durations[stage] = time.perf_counter() - started
+            self.sampler.exit(stage)
+
+    def _flow(self, user_id: int) -> FlowResult:
+        from app.services.audit_runner import execute_audit, prepare_pdf_path
+        from app.services.email_service import send_report
+        from app.services.payments import create_checkout_session
+        from app.utils.file_manager import persist_contract
+
+        result = FlowResult(started_at=time.monotonic())
+        email = f"user{user_id}@load-test.local"
+        workspace = None
+        try:
+            checkout_url = self._run_stage(
+                result,
+                "checkout",
+                create_checkout_session,
+                self.config.stripe,
+                customer_email=email,
+                success_params={"session_id": "{CHECKOUT_SESSION_ID}"},
+            )
+
+            def _verify() -> None:
+                self.shim.session_state.clear()
+                self.shim.session_state["customer_email"] = email
+                self.shim.set_query_params(session_id=checkout_url.rsplit("/", 1)[-1])
+                verified = self.main._process_success_flow()
+                if verified != email:
+                    warnings = "; ".join(self.shim.pop_warnings()) or "payment not verified"
+                    raise RuntimeError(warnings)
+
+            self._run_stage(result, "payment", _verify)
+
+            def _audit() -> Any:
+                nonlocal workspace
+                workspace = self.workspaces.create()
+                contract_path = persist_contract(io.BytesIO(self.contract_bytes), workspace)
+                return execute_audit(
+                    self.config,
+                    contract_path,
+                    self.main.PROMPT_TEMPLATE,
+                    prepare_pdf_path(workspace),
+                )
+
+            _, _, summary_text, pdf_path, exports = self._run_stage(result, "audit", _audit)
+            self._run_stage(
+                result,
+                "email",
+                send_report,
+                self.config.email,
+                email,
+                summary_text,
+                pdf_path,
+                attachments=exports.paths(),
+            )
+        except Exception:
+            pass
+        finally:
+            result.finished_at = time.monotonic()
+            if workspace is not None:
+                self.workspaces.release(workspace)
+        return result
+
+    def _user(self, user_id: int) -> None:
+        while not self._stop.is_set():
+            result = self._flow(user_id)
+            with self._results_lock:
+                self.results.append(result)
+            if self.args.think_time:
+                self._stop.wait(self.args.think_time)
+
+    def _step_levels(self) -> List[int]:
+        levels = list(range(self.args.step_users, self.args.users + 1, self.args.step_users))
+        if not levels or levels[-1] != self.args.users:
+            levels.append(self.args.users)
+        return levels
+
+    def run(self) -> Dict[str, Any]:
+        ports = self._start_fakes()
+        os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{ports['openai']}/v1"
+
+        import stripe
+
+        import app.main as main
+        from app.utils.tracing import configure_tracing
+        from app.utils.workspace_manager import WorkspaceManager
+
+        stripe.api_base = f"http://127.0.0.1:{ports['stripe']}"
+        main.st = self.shim
+        self.main = main
+        self.config = self._build_config(ports)
+        main.init_stripe(self.config.stripe)
+        configure_tracing(self.config.tracing)
+        self.workspaces = WorkspaceManager(self.config.workspace)
+        self.workspaces.start()
+
+        started = time.monotonic()
+        self.sampler.start()
+        threads: List[threading.Thread] = []
+        for level in self._step_levels():
+            while len(threads) < level:
+                thread = threading.Thread(
+                    target=self._user, args=(len(threads),), name=f"vu-{len(threads)}", daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+            step_start = time.monotonic()
+            print(
+                f"[{step_start - started:7.1f}s] holding {level} virtual users "
+                f"for {self.args.step_seconds:.0f}s",
+                flush=True,
+            )
+            time.sleep(self.args.step_seconds)
+            self.steps.append((level, step_start, time.monotonic()))
+        self._stop.set()
+        print("Waiting for in-flight flows to finish...", flush=True)
+        for thread in threads:
+            thread.join()
+        wall_time = time.monotonic() - started
+        self.sampler.stop()
+        self.workspaces.stop(timeout=30)
+        return self.report(wall_time, SMTPSinkHandler.received)
+
+    # ---------------------------------------------------------------- reporting
+
+    @staticmethod
+    def _latency_stats(values: List[float]) -> Dict[str, Optional[float]]:
+        return {
+            "count": len(values),
+            "p50": percentile(values, 50),
+            "p90": percentile(values, 90),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": max(values) if values else None,
+        }
+
+    def _stage_saturation(self, stage: str) -> Dict[str, Optional[float]]:
+        active = [sample for sample in self.sampler.samples if sample["in_flight"].get(stage, 0) > 0]
+
+        def _peak(key: str) -> Optional[float]:
+            values = [sample[key] for sample in active if sample[key] is not None]
+            return max(values) if values else None
+
+        def _mean(key: str) -> Optional[float]:
+            values = [sample[key] for sample in active if sample[key] is not None]
+            return sum(values) / len(values) if values else None
+
+        return {
+            "peak_in_flight": max((sample["in_flight"][stage] for sample in active), default=0),
+            "mean_load1": _mean("load1"),
+            "peak_load1": _peak("load1"),
+            "peak_memory_used_pct": _peak("memory_used_pct"),
+            "peak_scanner_processes": _peak("scanner_processes"),
+        }
+
+    def report(self, wall_time: float, emails_received: int) -> Dict[str, Any]:
+        stages: Dict[str, Any] = {}
+        for stage in STAGES:
+            attempted = [result for result in self.results if stage in result.durations]
+            failed = [result for result in attempted if result.failed_stage == stage]
+            succeeded = [result.durations[stage] for result in attempted if result.failed_stage != stage]
+            errors: Dict[str, int] = defaultdict(int)
+            for result in failed:
+                errors[result.error or "unknown"] += 1
+            stages[stage] = {
+                "latency_seconds": self._latency_stats(succeeded),
+                "attempts": len(attempted),
+                "error_rate": len(failed) / len(attempted) if attempted else None,
+                "top_errors": dict(sorted(errors.items(), key=lambda item: -item[1])[:3]),
+                "saturation": self._stage_saturation(stage),
+            }
+
+        levels: Dict[int, Any] = {}
+        attributed = 0
+        for level, step_start, step_end in self.steps:
+            # Flows that straddle a step boundary ran at a mix of concurrencies; drop them.
+            results = [
+                result
+                for result in self.results
+                if step_start <= result.started_at and result.finished_at <= step_end
+            ]
+            attributed += len(results)
+            completed_totals = [result.total for result in results if result.failed_stage is None]
+            error_rate = 1 - len(completed_totals) / len(results) if results else None
+            p95 = percentile(completed_totals, 95)
+            mean = sum(completed_totals) / len(completed_totals) if completed_totals else None
+            levels[level] = {
+                "step_seconds": step_end - step_start,
+                "flows": len(results),
+                "enough_samples": len(results) >= self.args.min_samples,
+                "error_rate": error_rate,
+                "end_to_end_p95_seconds": p95,
+                # Little's law: users / (mean time in system + think time between flows).
+                "audits_per_hour": 3600 * level / (mean + self.args.think_time) if mean else 0.0,
+                "within_slo": bool(
+                    len(results) >= self.args.min_samples
+                    and error_rate is not None
+                    and error_rate <= self.args.max_error_rate
+                    and p95 is not None
+                    and p95 <= self.args.slo_seconds
+                ),
+            }
+
+        # Capacity is the largest step such that it and every smaller step met the SLO.
+        max_users = 0
+        for level, stats in levels.items():
+            if not stats["within_slo"]:
+                break
+            max_users = level
+        completed = [result for result in self.results if result.failed_stage is None]
+        return {
+            "parameters": {
+                key: value for key, value in vars(self.args).items() if key not in {"output"}
+            },
+            "wall_time_seconds": wall_time,
+            "flows_started": len(self.results),
+            "flows_completed": len(completed),
+            "flows_spanning_steps": len(self.results) - attributed,
+            "emails_received": emails_received,
+            "throughput_audits_per_hour": 3600 * len(completed) / wall_time if wall_time else 0.0,
+            "stages": stages,
+            "concurrency_levels": levels,
+            "capacity": {
+                "max_concurrent_users_within_slo": max_users,
+                "audits_per_hour_at_capacity": levels[max_users]["audits_per_hour"] if max_users else 0.0,
+                "slo_seconds": self.args.slo_seconds,
+                "max_error_rate": self.args.max_error_rate,
+                "min_samples": self.args.min_samples,
+                "cpu_count": os.cpu_count(),
+            },
+        }
+
+
+def _fmt(value: Optional[float], suffix: str = "") -> str:
+    return "-" if value is None else f"{value:,.2f}{suffix}"
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print("\n=== Capacity report ===")
+    print(
+        f"Wall time {report['wall_time_seconds']:,.0f}s, flows {report['flows_completed']}/"
+        f"{report['flows_started']} completed, {report['emails_received']} emails received, "
+        f"{report['throughput_audits_per_hour']:,.1f} audits/hour overall, "
+        f"{report['flows_spanning_steps']} flows spanned a step boundary and were not attributed"
+    )
+    print(f"\n{'STAGE':<9} {'N':>5} {'ERR%':>6} {'P50':>9} {'P95':>9} {'P99':>9} {'INFL':>6} {'LOAD':>6} {'MEM%':>6} {'SCAN':>5}")
+    for stage, stats in report["stages"].items():
+        latency = stats["latency_seconds"]
+        saturation = stats["saturation"]
+        error_rate = stats["error_rate"]
+        print(
+            f"{stage:<9} {stats['attempts']:>5} {_fmt(None if error_rate is None else 100 * error_rate):>6} "
+            f"{_fmt(latency['p50'], 's'):>9} {_fmt(latency['p95'], 's'):>9} {_fmt(latency['p99'], 's'):>9} "
+            f"{saturation['peak_in_flight']:>6} {_fmt(saturation['peak_load1']):>6} "
+            f"{_fmt(saturation['peak_memory_used_pct']):>6} {saturation['peak_scanner_processes'] or '-':>5}"
+        )
+        for error, count in stats["top_errors"].items():
+            print(f"{'':<9} ! {count}x {error[:100]}")
+
+    print(f"\n{'USERS':>5} {'FLOWS':>6} {'ERR%':>6} {'E2E P95':>10} {'AUDITS/H':>9}  SLO")
+    for level, stats in report["concurrency_levels"].items():
+        error_rate = stats["error_rate"]
+        if not stats["enough_samples"]:
+            verdict = "too few samples"
+        else:
+            verdict = "ok" if stats["within_slo"] else "MISS"
+        print(
+            f"{level:>5} {stats['flows']:>6} {_fmt(None if error_rate is None else 100 * error_rate):>6} "
+            f"{_fmt(stats['end_to_end_p95_seconds'], 's'):>10} {stats['audits_per_hour']:>9.1f}  "
+            f"{verdict}"
+        )
+
+    capacity = report["capacity"]
+    print(
+        f"\nSizing: one container ({capacity['cpu_count']} CPUs) sustains "
+        f"{capacity['max_concurrent_users_within_slo']} concurrent customers "
+        f"(~{capacity['audits_per_hour_at_capacity']:,.0f} audits/hour) with end-to-end p95 <= "
+        f"{capacity['slo_seconds']:.0f}s and error rate <= {100 * capacity['max_error_rate']:.1f}%."
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=4, help="Peak number of virtual users.")
+    parser.add_argument("--step-users", type=int, default=1, help="Users added per load step.")
+    parser.add_argument(
+        "--step-seconds",
+        type=float,
+        default=900.0,
+        help="How long each user count is held; use several times the end-to-end audit time.",
+    )
+    parser.add_argument(
+        "--min-samples",
+        type=int,
+        default=5,
+        help="Flows a step needs, started and finished within it, to count toward capacity.",
+    )
+    parser.add_argument("--think-time", type=float, default=0.0, help="Pause between a user's flows.")
+    parser.add_argument("--contract", help="Solidity file to audit (defaults to the README example).")
+    parser.add_argument("--stripe-latency", type=float, default=0.3, help="Fake Stripe latency (s).")
+    parser.add_argument("--openai-latency", type=float, default=8.0, help="Fake OpenAI latency (s).")
+    parser.add_argument("--smtp-latency", type=float, default=0.5, help="Fake SMTP DATA latency (s).")
+    parser.add_argument("--slo-seconds", type=float, default=300.0, help="End-to-end p95 target.")
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="Acceptable error rate.")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="Resource sampling period.")
+    parser.add_argument("--trace", action="store_true", help="Also write audit traces to the work dir.")
+    parser.add_argument("--output", help="Write the capacity report as JSON to this path.")
+    args = parser.parse_args(argv)
+    if args.users < 1:
+        parser.error("--users must be at least 1")
+    if args.step_users < 1:
+        parser.error("--step-users must be at least 1")
+    if args.min_samples < 1:
+        parser.error("--min-samples must be at least 1")
+
+    load_test = LoadTest(args)
+    report = load_test.run()
+    print_report(report)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nCapacity report written to {args.output}")
+    print(f"Artifacts and traces: {load_test.workdir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""Offline viewer for audit traces written by ``app.utils.tracing``.
+
+Reads the rotating OTLP/JSON trace files, lists the slowest audits and renders
+their span trees either in the terminal or as a self-contained HTML flame chart.
+
+Usage::
+
+    python scripts/trace_viewer.py                       # top 5 slowest audits
+    python scripts/trace_viewer.py --top 20 --html slow.html
+    python scripts/trace_viewer.py --trace <trace-id>
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import html
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_TRACE_FILE = os.getenv("AUDIT_TRACE_FILE", "/tmp/audit-traces/traces.jsonl")
+BAR_WIDTH = 40
+ROW_HEIGHT = 22
+
+
+@dataclass
+class SpanRecord:
+    name: str
+    span_id: str
+    parent_span_id: Optional[str]
+    start_ns: int
+    end_ns: int
+    status_code: int
+    status_message: str
+    attributes: Dict[str, str]
+    children: List["SpanRecord"] = field(default_factory=list)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+
+@dataclass
+class TraceRecord:
+    trace_id: str
+    root: SpanRecord
+
+    @property
+    def duration_ms(self) -> float:
+        return self.root.duration_ms
+
+    @property
+    def failed(self) -> bool:
+        return any(span.status_code == 2 for span in _walk(self.root))
+
+
+def _walk(span: SpanRecord) -> Iterable[SpanRecord]:
+    yield span
+    for child in span.children:
+        yield from _walk(child)
+
+
+def _attribute_value(value: Dict[str, object]) -> str:
+    for key in ("stringValue", "intValue", "doubleValue", "boolValue"):
+        if key in value:
+            return str(value[key])
+    return json.dumps(value)
+
+
+def _parse_line(line: str) -> Iterable[TraceRecord]:
+    request = json.loads(line)
+    spans_by_trace: Dict[str, List[SpanRecord]] = {}
+    for resource_spans in request.get("resourceSpans", []):
+        for scope_spans in resource_spans.get("scopeSpans", []):
+            for raw in scope_spans.get("spans", []):
+                spans_by_trace.setdefault(raw["traceId"], []).append(
+                    SpanRecord(
+                        name=raw["name"],
+                        span_id=raw["spanId"],
+                        parent_span_id=raw.get("parentSpanId"),
+                        start_ns=int(raw["startTimeUnixNano"]),
+                        end_ns=int(raw["endTimeUnixNano"]),
+                        status_code=int(raw.get("status", {}).get("code", 0)),
+                        status_message=raw.get("status", {}).get("message", ""),
+                        attributes={
+                            item["key"]: _attribute_value(item["value"])
+                            for item in raw.get("attributes", [])
+                        },
+                    )
+                )
+
+    for trace_id, spans in spans_by_trace.items():
+        by_id = {span.span_id: span for span in spans}
+        roots = []
+        for span in spans:
+            parent = by_id.get(span.parent_span_id or "")
+            if parent is None:
+                roots.append(span)
+            else:
+                parent.children.append(span)
+        for span in spans:
+            span.children.sort(key=lambda child: child.start_ns)
+        for root in roots:
+            yield TraceRecord(trace_id=trace_id, root=root)
+
+
+def load_traces(pattern: str) -> List[TraceRecord]:
+    traces: List[TraceRecord] = []
+    for path in sorted(glob.glob(f"{pattern}*")):
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    traces.extend(_parse_line(line))
+                except (KeyError, ValueError) as exc:
+                    print(f"Skipping malformed trace in {path}: {exc}", file=sys.stderr)
+    return traces
+
+
+def _format_start(start_ns: int) -> str:
+    return datetime.fromtimestamp(start_ns / 1e9, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def print_summary(traces: List[TraceRecord]) -> None:
+    print(f"{'TRACE ID':<32}  {'STARTED (UTC)':<19}  {'TOTAL':>10}  STATUS  SLOWEST STAGE")
+    for trace in traces:
+        stages = [span for span in _walk(trace.root) if span is not trace.root and not span.children]
+        slowest = max(stages, key=lambda span: span.duration_ms, default=None)
+        slowest_label = f"{slowest.name} ({slowest.duration_ms:,.0f} ms)" if slowest else "-"
+        print(
+            f"{trace.trace_id:<32}  {_format_start(trace.root.start_ns):<19}  "
+            f"{trace.duration_ms:>7,.0f} ms  {'ERROR ' if trace.failed else 'ok    '}  {slowest_label}"
+        )
+
+
+def print_tree(trace: TraceRecord) -> None:
+    total_ns = max(trace.root.end_ns - trace.root.start_ns, 1)
+    print(f"\nTrace {trace.trace_id}  ({trace.duration_ms:,.0f} ms)")
+
+    def _print(span: SpanRecord, depth: int) -> None:
+        offset = int(BAR_WIDTH * (span.start_ns - trace.root.start_ns) / total_ns)
+        width = max(1, int(BAR_WIDTH * (span.end_ns - span.start_ns) / total_ns))
+        bar = " " * offset + "#" * min(width, BAR_WIDTH - offset)
+        label = f"{'  ' * depth}{span.name}"
+        error = f"  ERROR: {span.status_message}" if span.status_code == 2 else ""
+        print(f"  {label:<28} |{bar:<{BAR_WIDTH}}| {span.duration_ms:>10,.1f} ms{error}")
+        for child in span.children:
+            _print(child, depth + 1)
+
+    _print(trace.root, 0)
+
+
+def _html_flame_chart(trace: TraceRecord) -> str:
+    total_ns = max(trace.root.end_ns - trace.root.start_ns, 1)
+    bars: List[str] = []
+    max_depth = 0
+
+    def _collect(span: SpanRecord, depth: int) -> None:
+        nonlocal max_depth
+        max_depth = max(max_depth, depth)
+        left = 100 * (span.start_ns - trace.root.start_ns) / total_ns
+        width = max(0.2, 100 * (span.end_ns - span.start_ns) / total_ns)
+        details = "\n".join(f"{key}: {value}" for key, value in span.attributes.items())
+        tooltip = f"{span.name} – {span.duration_ms:,.1f} ms\n{details}".strip()
+        css_class = "span error" if span.status_code == 2 else "span"
+        bars.append(
+            f'<div class="{css_class}" style="left:{left:.3f}%;width:{width:.3f}%;'
+            f'top:{depth * ROW_HEIGHT}px" title="{html.escape(tooltip)}">'
+            f"{html.escape(span.name)} ({span.duration_ms:,.0f} ms)</div>"
+        )
+        for child in span.children:
+            _collect(child, depth + 1)
+
+    _collect(trace.root, 0)
+    status = "ERROR" if trace.failed else "ok"
+    return (
+        f"<h2>{html.escape(trace.trace_id)} – {trace.duration_ms:,.0f} ms – {status}"
+        f" <small>{_format_start(trace.root.start_ns)} UTC</small></h2>"
+        f'<div class="chart" style="height:{(max_depth + 1) * ROW_HEIGHT}px">{"".join(bars)}</div>'
+    )
+
+
+def write_html(traces: List[TraceRecord], output_path: str) -> None:
+    charts = "\n".join(_html_flame_chart(trace) for trace in traces)
+    document = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Audit traces</title>
+<style>
+body {{ font-family: sans-serif; margin: 24px; color: #111827; }}
+h2 {{ font-size: 15px; margin: 24px 0 6px; }}
+small {{ color: #6B7280; font-weight: normal; }}
+.chart {{ position: relative; border: 1px solid #E5E7EB; background: #F9FAFB; }}
+.span {{ position: absolute; height: {ROW_HEIGHT - 2}px; line-height: {ROW_HEIGHT - 2}px;
+  font-size: 11px; padding: 0 4px; box-sizing: border-box; overflow: hidden;
+  white-space: nowrap; background: #F59E0B; border: 1px solid #FFFFFF; cursor: default; }}
+.span.error {{ background: #EF4444; color: #FFFFFF; }}
+</style></head>
+<body><h1>Slowest audits</h1>
+{charts}
+</body></html>
+"""
+    with open(output_path, "w", encoding="utf-8") as handle:
+        handle.write(document)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "trace_file",
+        nargs="?",
+        default=DEFAULT_TRACE_FILE,
+        help="Trace file; rotated backups (traces.jsonl.1, ...) are read too.",
+    )
+    parser.add_argument("--top", type=int, default=5, help="Number of slowest audits to show.")
+    parser.add_argument("--trace", help="Show a single trace by ID.")
+    parser.add_argument("--html", metavar="PATH", help="Write an HTML flame chart to PATH.")
+    args = parser.parse_args(argv)
+
+    traces = load_traces(args.trace_file)
+    if args.trace:
+        traces = [trace for trace in traces if trace.trace_id == args.trace]
+    if not traces:
+        print("No traces found.", file=sys.stderr)
+        return 1
+
+    traces.sort(key=lambda trace: trace.duration_ms, reverse=True)
+    selected = traces[: args.top]
+
+    print_summary(selected)
+    for trace in selected:
+        print_tree(trace)
+    if args.html:
+        write_html(selected, args.html)
+        print(f"\nFlame chart written to {args.html}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+pytest.importorskip("openai")
+
+from app.config import OpenAIConfig
+from app.services import ai_summary
+from app.services.explanation_cache import finding_type
+from app.services.report_export import Finding
+
+
+def _finding(rule_id: str, tool: str = "Mythril") -> Finding:
+    return Finding(tool=tool, rule_id=rule_id, title=f"Title {rule_id}", severity="High", message="")
+
+
+def _response(text: str) -> SimpleNamespace:
+    return SimpleNamespace(output=[SimpleNamespace(content=[SimpleNamespace(text=text)])])
+
+
+class _FakeResponses:
+    """Answers explanation requests with one explanation per requested type."""
+
+    def __init__(self, fail_types: tuple[str, ...] = (), overview_prompt: str = "") -> None:
+        self.fail_types = fail_types
+        self.overview_prompt = overview_prompt
+        self.explanation_calls: List[Dict[str, Any]] = []
+
+    def create(self, **request: Any) -> SimpleNamespace:
+        if request["input"][0]["content"] == self.overview_prompt:
+            return _response("## Overview\n\nContract-specific overview.")
+        self.explanation_calls.append(request)
+        kinds = [item["type"] for item in json.loads(request["input"][1]["content"])]
+        if any(kind in self.fail_types for kind in kinds):
+            raise RuntimeError("model unavailable")
+        return _response(json.dumps({kind: f"Explains {kind}." for kind in kinds}))
+
+
+def _config(tmp_path: Path) -> OpenAIConfig:
+    return OpenAIConfig(
+        api_key="test",
+        model="gpt-4o-mini",
+        explanation_cache_path=str(tmp_path / "explanations.sqlite3"),
+    )
+
+
+def test_parse_explanations_strips_code_fences() -> None:
+    text = '```json\n{"Mythril:SWC-107": " Reentrancy. ", "slither:tx-origin": "  "}\n```'
+    assert ai_summary._parse_explanations(text) == {"mythril:swc-107": "Reentrancy."}
+
+
+@pytest.mark.parametrize("text", ["not json", '["a list"]', '"a string"'])
+def test_parse_explanations_rejects_non_object_replies(text: str) -> None:
+    assert ai_summary._parse_explanations(text) == {}
+
+
+def test_compose_summary_explains_each_type_once() -> None:
+    findings = [_finding("SWC-107"), _finding("SWC-107"), _finding("SWC-110")]
+    explanations = {finding_type(findings[0]): "Reentrancy."}
+
+    assert ai_summary.compose_summary(" ## Overview \n", findings, explanations) == (
+        "## Overview\n\n## Finding Explanations\n\n"
+        "### Title SWC-107 (Mythril SWC-107)\n\nReentrancy."
+    )
+    assert ai_summary.compose_summary("## Overview", findings, {}) == "## Overview"
+
+
+def test_explain_findings_chunks_requests_and_caches_results(tmp_path: Path) -> None:
+    config = _config(tmp_path)
+    findings = [_finding(f"SWC-{number}") for number in range(100, 120)]
+    responses = _FakeResponses(fail_types=("mythril:swc-100",))
+    client = SimpleNamespace(responses=responses)
+
+    explanations = ai_summary.explain_findings(config, client, findings)
+
+    chunk = ai_summary._EXPLANATION_CHUNK_SIZE
+    assert len(responses.explanation_calls) == -(-len(findings) // chunk)
+    assert all(
+        call["max_output_tokens"] <= ai_summary._EXPLANATION_TOKENS_PER_TYPE * chunk
+        for call in responses.explanation_calls
+    )
+    # The failing chunk is skipped; the others are still returned.
+    assert len(explanations) == len(findings) - chunk
+    assert "mythril:swc-100" not in explanations
+
+    retry = _FakeResponses()
+    explanations = ai_summary.explain_findings(config, SimpleNamespace(responses=retry), findings)
+    assert len(explanations) == len(findings)
+    # Only the types from the failed chunk are requested again.
+    assert len(retry.explanation_calls) == 1
+
+
+def test_generate_summary_falls_back_to_overview_when_explanations_fail(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prompt = tmp_path / "overview_prompt.md"
+    prompt.write_text("Write an overview.", encoding="utf-8")
+    responses = _FakeResponses(overview_prompt="Write an overview.")
+    monkeypatch.setattr(ai_summary.openai, "OpenAI", lambda **_: SimpleNamespace(responses=responses))
+
+    def _broken_explanations(*_: Any) -> Dict[str, str]:
+        raise RuntimeError("cache unavailable")
+
+    monkeypatch.setattr(ai_summary, "explain_findings", _broken_explanations)
+
+    summary = ai_summary.generate_summary(
+        _config(tmp_path), prompt, {}, {}, findings=[_finding("SWC-107")]
+    )
+    assert summary == "## Overview\n\nContract-specific overview."
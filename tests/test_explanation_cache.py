@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.services.explanation_cache import ExplanationCache, cache_key, finding_type, prompt_hash
+from app.services.report_export import Finding
+
+
+def test_cache_key_depends_on_type_model_and_prompt() -> None:
+    digest = prompt_hash("Explain each finding type.")
+    key = cache_key("mythril:swc-107", "gpt-4o-mini", digest)
+
+    assert key == cache_key("mythril:swc-107", "gpt-4o-mini", digest)
+    assert key != cache_key("mythril:swc-110", "gpt-4o-mini", digest)
+    assert key != cache_key("mythril:swc-107", "gpt-4o", digest)
+    assert key != cache_key("mythril:swc-107", "gpt-4o-mini", prompt_hash("Explain briefly."))
+
+
+def test_finding_type_is_normalized() -> None:
+    finding = Finding(tool="Mythril", rule_id=" SWC-107 ", title="", severity="High", message="")
+    assert finding_type(finding) == "mythril:swc-107"
+
+
+def test_get_many_returns_only_stored_keys(tmp_path: Path) -> None:
+    cache = ExplanationCache(str(tmp_path / "cache" / "explanations.sqlite3"))
+    cache.put_many({"a": ("slither:tx-origin", "Avoid tx.origin."), "b": ("mythril:swc-107", "Old.")})
+    cache.put_many({"b": ("mythril:swc-107", "Reentrancy.")})
+
+    assert cache.get_many(["a", "b", "missing", "a"]) == {
+        "a": "Avoid tx.origin.",
+        "b": "Reentrancy.",
+    }
+    assert cache.get_many([]) == {}
+
+
+def test_entries_persist_across_instances(tmp_path: Path) -> None:
+    path = str(tmp_path / "explanations.sqlite3")
+    ExplanationCache(path).put_many({"a": ("slither:tx-origin", "Avoid tx.origin.")})
+
+    assert ExplanationCache(path).get_many(["a"]) == {"a": "Avoid tx.origin."}
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from app.services.report_export import Finding, build_sarif
+
+
+def _finding(severity: str) -> Finding:
+    return Finding(
+        tool="Mythril",
+        rule_id="SWC-107",
+        title="External call",
+        severity=severity,
+        message="call to untrusted contract",
+    )
+
+
+def test_rule_carries_highest_security_severity() -> None:
+    sarif = build_sarif([_finding("Low"), _finding("High")])
+    mythril_run = next(run for run in sarif["runs"] if run["tool"]["driver"]["name"] == "Mythril")
+
+    (rule,) = mythril_run["tool"]["driver"]["rules"]
+    assert rule["id"] == "SWC-107"
+    assert rule["properties"]["security-severity"] == "8.0"
+    assert [result["level"] for result in mythril_run["results"]] == ["note", "error"]
+    assert all("properties" not in result for result in mythril_run["results"])
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from app.config import TracingConfig
+from app.utils import tracing
+
+
+def _config(path: Path) -> TracingConfig:
+    return TracingConfig(enabled=True, file_path=str(path), max_bytes=1024 * 1024, backup_count=1)
+
+
+def test_unwritable_trace_file_disables_tracing(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+
+    tracing.configure_tracing(_config(blocker / "traces.jsonl"))
+
+    with tracing.start_span("audit") as span:
+        assert span.trace_id
+
+
+def test_trace_is_exported_when_root_span_ends(tmp_path: Path) -> None:
+    trace_file = tmp_path / "traces.jsonl"
+    tracing.configure_tracing(_config(trace_file))
+    try:
+        with tracing.start_span("audit"):
+            with tracing.start_span("slither"):
+                assert tracing.subprocess_env()["TRACEPARENT"].startswith("00-")
+    finally:
+        tracing.configure_tracing(TracingConfig(False, "", 0, 0))
+
+    spans = json.loads(trace_file.read_text())["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [span["name"] for span in spans] == ["slither", "audit"]
+
+
+def test_reconfiguring_closes_previous_trace_file(tmp_path: Path) -> None:
+    tracing.configure_tracing(_config(tmp_path / "first.jsonl"))
+    first_handler = tracing._exporter._handler
+    try:
+        tracing.configure_tracing(_config(tmp_path / "second.jsonl"))
+        assert first_handler.stream is None
+    finally:
+        tracing.configure_tracing(TracingConfig(False, "", 0, 0))
+    assert tracing._exporter is None
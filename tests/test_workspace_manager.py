@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from app.config import WorkspaceConfig
+from app.utils.file_manager import WORKSPACE_PREFIX
+from app.utils.workspace_manager import WorkspaceManager
+
+
+def _manager(root: Path, ttl_seconds: int = 60) -> WorkspaceManager:
+    return WorkspaceManager(
+        WorkspaceConfig(
+            storage_root=str(root),
+            tmpfs_root=None,
+            tmpfs_quota_bytes=0,
+            ttl_seconds=ttl_seconds,
+            sweep_interval_seconds=300,
+        )
+    )
+
+
+def _age(path: Path) -> None:
+    os.utime(path, (0, 0))
+
+
+def test_sweep_removes_only_stale_workspaces(tmp_path: Path) -> None:
+    manager = _manager(tmp_path)
+
+    stale = tmp_path / f"{WORKSPACE_PREFIX}stale"
+    stale.mkdir()
+    (stale / "contract.sol").write_text("contract A {}")
+    _age(stale)
+
+    fresh = tmp_path / f"{WORKSPACE_PREFIX}fresh"
+    fresh.mkdir()
+
+    foreign_dir = tmp_path / "old"
+    foreign_dir.mkdir()
+    (foreign_dir / "keep.txt").write_text("not ours")
+    _age(foreign_dir)
+
+    foreign_file = tmp_path / f"{WORKSPACE_PREFIX}file"
+    foreign_file.write_text("not a workspace")
+    _age(foreign_file)
+
+    assert manager.sweep() == 1
+    assert not stale.exists()
+    assert fresh.exists()
+    assert (foreign_dir / "keep.txt").read_text() == "not ours"
+    assert foreign_file.exists()
+
+
+def test_sweep_skips_active_workspaces(tmp_path: Path) -> None:
+    manager = _manager(tmp_path)
+    workspace = manager.create()
+    assert workspace.name.startswith(WORKSPACE_PREFIX)
+    _age(workspace)
+
+    assert manager.sweep() == 0
+    assert workspace.exists()
+
+    manager.release(workspace)
+    assert not workspace.exists()
+
+
+def test_sweep_does_not_follow_symlinked_workspaces(tmp_path: Path) -> None:
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "keep.txt").write_text("not ours")
+    root = tmp_path / "root"
+    root.mkdir()
+    link = root / f"{WORKSPACE_PREFIX}link"
+    link.symlink_to(target, target_is_directory=True)
+
+    assert _manager(root, ttl_seconds=-1).sweep() == 0
+    assert (target / "keep.txt").exists()